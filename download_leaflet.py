@@ -5,36 +5,52 @@ Run this once before Field Day to ensure map works without internet
 """
 
 import os
+import shutil
 import urllib.request
-
-# Create www/lib directory if it doesn't exist
-os.makedirs('www/lib', exist_ok=True)
-
-print("Downloading Leaflet.js for offline use...")
-
-# Download Leaflet CSS
-leaflet_css_url = "https://unpkg.com/leaflet@1.9.4/dist/leaflet.css"
-print(f"Downloading {leaflet_css_url}")
-urllib.request.urlretrieve(leaflet_css_url, 'www/lib/leaflet.css')
-
-# Download Leaflet JS
-leaflet_js_url = "https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"
-print(f"Downloading {leaflet_js_url}")
-urllib.request.urlretrieve(leaflet_js_url, 'www/lib/leaflet.js')
-
-# Download marker icons
-marker_icon_url = "https://unpkg.com/leaflet@1.9.4/dist/images/marker-icon.png"
-print(f"Downloading {marker_icon_url}")
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import urllib3  # pooled keep-alive connections to unpkg.com
+except ImportError:
+    urllib3 = None
+
+LEAFLET_BASE = "https://unpkg.com/leaflet@1.9.4/dist"
+
+FILES = [
+    (f"{LEAFLET_BASE}/leaflet.css", 'www/lib/leaflet.css'),
+    (f"{LEAFLET_BASE}/leaflet.js", 'www/lib/leaflet.js'),
+    (f"{LEAFLET_BASE}/images/marker-icon.png", 'www/lib/images/marker-icon.png'),
+    (f"{LEAFLET_BASE}/images/marker-icon-2x.png", 'www/lib/images/marker-icon-2x.png'),
+    (f"{LEAFLET_BASE}/images/marker-shadow.png", 'www/lib/images/marker-shadow.png'),
+]
+
+http = urllib3.PoolManager(maxsize=len(FILES)) if urllib3 else None
+
+
+def fetch(url, dest):
+    print(f"Downloading {url}")
+    if http is None:
+        urllib.request.urlretrieve(url, dest)
+        return
+    r = http.request("GET", url, preload_content=False)
+    try:
+        if r.status != 200:
+            raise RuntimeError(f"{url} returned HTTP {r.status}")
+        with open(dest, 'wb') as f:
+            shutil.copyfileobj(r, f)
+    finally:
+        r.release_conn()
+
+
+# Create www/lib directories if they don't exist
 os.makedirs('www/lib/images', exist_ok=True)
-urllib.request.urlretrieve(marker_icon_url, 'www/lib/images/marker-icon.png')
 
-marker_icon_2x_url = "https://unpkg.com/leaflet@1.9.4/dist/images/marker-icon-2x.png"
-print(f"Downloading {marker_icon_2x_url}")
-urllib.request.urlretrieve(marker_icon_2x_url, 'www/lib/images/marker-icon-2x.png')
+print("Downloading Leaflet.js for offline use...")
 
-marker_shadow_url = "https://unpkg.com/leaflet@1.9.4/dist/images/marker-shadow.png"
-print(f"Downloading {marker_shadow_url}")
-urllib.request.urlretrieve(marker_shadow_url, 'www/lib/images/marker-shadow.png')
+# Fetch all files in parallel; result() re-raises any download error
+with ThreadPoolExecutor(max_workers=len(FILES)) as pool:
+    for future in [pool.submit(fetch, url, dest) for url, dest in FILES]:
+        future.result()
 
 print("\n✅ Leaflet downloaded successfully!")
 print("All map resources are now available offline in www/lib/")
@@ -0,0 +1,102 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C accelerator for the N3FJP tag parser in server.py
+
+Build in place (needs Cython and a C compiler):
+    pip install cython
+    cythonize -i fast_n3fjp.pyx
+
+server.py picks it up automatically and falls back to the pure-Python
+parser when the module isn't built.
+"""
+
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+
+# Raw tag bytes -> uppercase str tag name
+cdef dict _names = {}
+
+
+cdef inline unsigned char _upper(unsigned char c):
+    if 97 <= c <= 122:
+        return c - 32
+    return c
+
+
+cdef inline bint _is_space(unsigned char c):
+    # Same set as bytes.strip(): space, \t, \n, \v, \f, \r
+    return c == 32 or 9 <= c <= 13
+
+
+cdef inline bint _is_tag_char(unsigned char c):
+    c = _upper(c)
+    return (65 <= c <= 90) or (48 <= c <= 57) or c == 95
+
+
+def scan_tags(bytes block):
+    """
+    Same result as server._parse_tags' _TAG_RE path: pair each <TAG> with the
+    first following </TAG> (case-insensitive), skip CMD/LISTRESPONSE, and
+    return a dict with UPPERCASE keys and stripped, decoded values.
+    """
+    cdef const unsigned char* p = block
+    cdef Py_ssize_t n = len(block)
+    cdef Py_ssize_t i = 0, lt, gt, tlen, j, k, end, vs, ve
+    cdef bint ok
+    cdef dict rec = {}
+    cdef object name
+
+    while True:
+        lt = i
+        while lt < n and p[lt] != 60:  # '<'
+            lt += 1
+        if lt >= n:
+            break
+        gt = lt + 1
+        while gt < n and p[gt] != 62:  # '>'
+            gt += 1
+        if gt >= n:
+            break
+
+        tlen = gt - lt - 1
+        ok = tlen > 0
+        k = lt + 1
+        while ok and k < gt:
+            ok = _is_tag_char(p[k])
+            k += 1
+        if not ok:
+            i = lt + 1
+            continue
+
+        # Find the first matching </TAG>
+        end = -1
+        j = gt + 1
+        while j + tlen + 2 < n:
+            if p[j] == 60 and p[j + 1] == 47 and p[j + tlen + 2] == 62:  # '<' '/' ... '>'
+                k = 0
+                while k < tlen and _upper(p[j + 2 + k]) == _upper(p[lt + 1 + k]):
+                    k += 1
+                if k == tlen:
+                    end = j
+                    break
+            j += 1
+        if end < 0:
+            i = lt + 1
+            continue
+        i = end + tlen + 3
+
+        raw = block[lt + 1:gt]
+        name = _names.get(raw)
+        if name is None:
+            name = raw.decode("ascii").upper()
+            _names[raw] = name
+        if name == "CMD" or name == "LISTRESPONSE":
+            continue
+        vs = gt + 1
+        ve = end
+        while vs < ve and _is_space(p[vs]):
+            vs += 1
+        while ve > vs and _is_space(p[ve - 1]):
+            ve -= 1
+        rec[name] = PyUnicode_DecodeUTF8(<const char*>p + vs, ve - vs, "ignore")
+
+    return rec
@@ -1,18 +1,28 @@
 import asyncio
 import json
+import logging
 import re
 import socket
-import time
+from collections import defaultdict, deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
 
 # ----------------------------
 # Config
@@ -32,6 +42,19 @@ DEFAULT_CONFIG = {
 }
 
 
+def dumps_json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it's installed."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
 def load_config() -> dict:
     if CONFIG_PATH.exists():
         try:
@@ -45,93 +68,186 @@ def load_config() -> dict:
 # N3FJP TCP API helpers
 # ----------------------------
 
-def n3fjp_cmd(
-    host: str,
-    port: int,
+_RECV_CHUNK = 1 << 16
+_RECV_BUFSIZE = 1 << 20  # seed responses run to several MB
+_INGEST_BATCH = 64  # streamed records folded into the aggregates per lock hold
+
+async def n3fjp_exchange(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
     cmd: str,
+    on_chunk: Callable[[bytes], Awaitable[None]],
     total_timeout: float = 5.0,
     idle_timeout: float = 0.35,
-) -> bytes:
+) -> int:
     """
-    Send cmd + CRLF, then read until:
+    Send cmd + CRLF on an already-open connection and hand each chunk of the
+    reply to on_chunk as it arrives. Reading stops when:
       - total_timeout expires, OR
-      - no data arrives for idle_timeout (after receiving at least 1 chunk)
-    Returns raw bytes.
+      - no data arrives for idle_timeout (after receiving at least 1 chunk), OR
+      - the peer closes the connection
+    The connection is left open. Returns the number of bytes received.
     """
     payload = (cmd.strip() + "\r\n").encode("utf-8", errors="ignore")
 
-    chunks: List[bytes] = []
-    start = time.time()
-    last_data = start
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + total_timeout
+    received = 0
 
-    with socket.create_connection((host, port), timeout=total_timeout) as s:
-        s.settimeout(idle_timeout)
-        s.sendall(payload)
+    writer.write(payload)
+    await writer.drain()
 
-        while True:
-            now = time.time()
-            if now - start >= total_timeout:
-                break
-            if chunks and (now - last_data) >= idle_timeout:
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            data = await asyncio.wait_for(reader.read(_RECV_CHUNK), timeout=min(idle_timeout, remaining))
+        except asyncio.TimeoutError:
+            if received:
                 break
+            continue
+        if not data:
+            break
+        received += len(data)
+        await on_chunk(data)
 
-            try:
-                data = s.recv(65535)
-                if not data:
-                    break
-                chunks.append(data)
-                last_data = time.time()
-            except socket.timeout:
-                continue
+    return received
+
+
+async def n3fjp_open(host: str, port: int, timeout: float) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFSIZE)
+    return reader, writer
+
+
+async def n3fjp_close(writer: asyncio.StreamWriter) -> None:
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
 
-    return b"".join(chunks)
 
+async def n3fjp_stream(
+    host: str,
+    port: int,
+    cmd: str,
+    on_chunk: Callable[[bytes], Awaitable[None]],
+    total_timeout: float = 5.0,
+    idle_timeout: float = 0.35,
+) -> int:
+    """
+    One-shot streaming command: connect, send, feed chunks to on_chunk, close.
+    """
+    reader, writer = await n3fjp_open(host, port, total_timeout)
+    try:
+        return await n3fjp_exchange(reader, writer, cmd, on_chunk, total_timeout, idle_timeout)
+    finally:
+        await n3fjp_close(writer)
+
+
+# Responses are parsed as raw bytes (tags and framing are ASCII) so a
+# multi-MB seed never gets decoded as a whole; only field values are.
+_TAG_RE = re.compile(rb"<([A-Z0-9_]+)>(.*?)</\1>", flags=re.DOTALL | re.IGNORECASE)
+
+# Raw tag name -> uppercase str tag name. N3FJP only ever sends a couple dozen
+# distinct tags, so this stays tiny and saves a decode + .upper() per field.
+_TAG_NAMES: Dict[bytes, str] = {}
 
-_TAG_RE = re.compile(r"<([A-Z0-9_]+)>(.*?)</\1>", flags=re.DOTALL | re.IGNORECASE)
+# Optional compiled scanner (see fast_n3fjp.pyx); _TAG_RE parsing otherwise
+try:
+    from fast_n3fjp import scan_tags as _c_scan_tags
+except ImportError:
+    _c_scan_tags = None
+
+
+def _parse_tags(block: bytes) -> Dict[str, str]:
+    if not block:
+        return {}
+    if _c_scan_tags is not None:
+        return _c_scan_tags(bytes(block))
 
-def _parse_tags(block: str) -> Dict[str, str]:
     rec: Dict[str, str] = {}
-    for tag, val in _TAG_RE.findall(block or ""):
-        tag_u = (tag or "").upper().strip()
-        if not tag_u or tag_u in ("CMD", "LISTRESPONSE"):
+    tag_names = _TAG_NAMES
+    for m in _TAG_RE.finditer(block):
+        tag = m.group(1)
+        tag_u = tag_names.get(tag)
+        if tag_u is None:
+            tag_u = tag_names[tag] = tag.decode("ascii").upper()
+        if tag_u == "CMD" or tag_u == "LISTRESPONSE":
             continue
-        rec[tag_u] = (val or "").strip()
+        rec[tag_u] = m.group(2).strip().decode("utf-8", errors="ignore")
     return rec
 
 
-def parse_cmd_records(text: str) -> List[Dict[str, str]]:
-    """
-    Hybrid parser for N3FJP LIST responses.
+_LISTRESP_BOUNDARY = re.compile(rb"<\s*(/?)\s*LISTRESPONSE\s*>", flags=re.IGNORECASE)
+_BOUNDARY_MAX = 32  # longest partial boundary tag worth carrying between chunks
 
-    Handles BOTH formats:
-      A) <LISTRESPONSE> ... </LISTRESPONSE>  (block/closed)
-      B) <LISTRESPONSE><TAG>..</TAG>...<LISTRESPONSE><TAG>..</TAG>... (marker-per-record, NO closing tags)
 
-    Returns list of dicts with UPPERCASE keys.
+class ListResponseStream:
+    """
+    Incremental record splitter for LIST responses arriving in chunks.
+
+    feed() returns the record blocks completed by that chunk; a record ends at
+    its </LISTRESPONSE> (format A) or at the next <LISTRESPONSE> marker
+    (format B). finish() flushes the final format-B record at end of data.
     """
-    records: List[Dict[str, str]] = []
-    if not text:
-        return records
-
-    # --- Format A: closed blocks ---
-    if re.search(r"</\s*LISTRESPONSE\s*>", text, flags=re.IGNORECASE):
-        blocks = re.findall(r"<LISTRESPONSE>(.*?)</LISTRESPONSE>", text, flags=re.DOTALL | re.IGNORECASE)
-        for blk in blocks:
-            rec = _parse_tags(blk)
-            if rec:
-                records.append(rec)
-        return records
-
-    # --- Format B: repeated <LISTRESPONSE> markers (no close tag) ---
-    # Split on the marker, each chunk is one record-ish region until next marker.
-    parts = re.split(r"<\s*LISTRESPONSE\s*>", text, flags=re.IGNORECASE)
-    # parts[0] is preamble; actual record chunks start at 1
-    for chunk in parts[1:]:
-        rec = _parse_tags(chunk)
-        if rec:
-            records.append(rec)
-
-    return records
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._in_record = False
+        self.saw_marker = False
+        self.saw_close = False
+
+    def feed(self, data: bytes) -> List[bytes]:
+        buf = self._buf
+        buf += data
+        blocks: List[bytes] = []
+        start: Optional[int] = 0 if self._in_record else None
+        keep = 0
+        for m in _LISTRESP_BOUNDARY.finditer(buf):
+            if start is not None:
+                blocks.append(bytes(buf[start:m.start()]))
+            if m.group(1):
+                self.saw_close = True
+                start = None
+            else:
+                self.saw_marker = True
+                start = m.end()
+            keep = m.end()
+
+        self._in_record = start is not None
+        if not self._in_record:
+            # Between records only a boundary tag split across chunks matters
+            keep = max(keep, len(buf) - _BOUNDARY_MAX)
+        del buf[:keep]
+        return blocks
+
+    def finish(self) -> List[bytes]:
+        blocks: List[bytes] = []
+        if self._in_record and not self.saw_close and self._buf:
+            blocks.append(bytes(self._buf))
+        self._buf.clear()
+        self._in_record = False
+        return blocks
+
+
+# N3FJP date formats: "01/26", "01/26 21:59", "2026/01/26" or "20260126"
+_DATE_RE = re.compile(r"(?:\d{4}/)?(\d{1,2})/(\d{1,2})|\d{4}(\d{2})(\d{2})$")
+# N3FJP time formats: "21:59", "21:59:59" or "2159"
+_TIME_RE = re.compile(r"(\d{1,2}):\d{2}|(\d{2})\d{2}")
+
+
+def hour_bucket(month: int, day: int, hour: int) -> int:
+    """Pack month/day/hour into one int key; orders the same as the hour label."""
+    return (month << 16) | (day << 8) | hour
+
+
+def hour_label(bucket: int) -> str:
+    return f"2026-{bucket >> 16:02d}-{(bucket >> 8) & 0xFF:02d}-{bucket & 0xFF:02d}"
 
 
 def points_from_modetest(modetest: str) -> int:
@@ -156,20 +272,47 @@ def build_list_cmd(n: int, include_all: bool = True) -> str:
 # Aggregation state
 # ----------------------------
 
+def sorted_rows(d: Dict[str, int], key_name: str, value_name: str = "Contacts") -> List[dict]:
+    """Counter dict -> list of row dicts, highest count first (ties keep insertion order)."""
+    return [{key_name: k, value_name: v} for k, v in sorted(d.items(), key=itemgetter(1), reverse=True)]
+
+
+def record_key(r: Dict[str, str]) -> Hashable:
+    """
+    Dedup key for a LIST record: the N3FJP primary key when present,
+    otherwise a (CALL, BAND, MODE, DATE, TIMEON) tuple.
+    """
+    get = r.get
+    pk_raw = get("FLDPRIMARYKEY") or get("PRIMARYKEY")
+    if pk_raw:
+        try:
+            return int(pk_raw)
+        except ValueError:
+            pass
+    return (
+        (get("CALL") or "").strip(),
+        (get("BAND") or "").strip(),
+        (get("MODE") or "").strip(),
+        (get("DATE") or get("QSODATE") or get("FLDQSODATE") or "").strip(),
+        (get("TIMEON") or get("FLDTIMEON") or "").strip(),
+    )
+
+
 @dataclass
 class Aggregates:
     seen_keys: Set[int] = field(default_factory=set)
+    seen_fallback_keys: Set[Tuple[str, ...]] = field(default_factory=set)  # records without a primary key
     total_contacts: int = 0
     total_points: int = 0
 
-    contacts_by_operator: Dict[str, int] = field(default_factory=dict)
-    points_by_operator: Dict[str, int] = field(default_factory=dict)
+    contacts_by_operator: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    points_by_operator: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
-    contacts_by_mode: Dict[str, int] = field(default_factory=dict)
-    contacts_by_band: Dict[str, int] = field(default_factory=dict)
-    contacts_by_continent: Dict[str, int] = field(default_factory=dict)
-    contacts_by_state: Dict[str, int] = field(default_factory=dict)
-    contacts_by_country: Dict[str, int] = field(default_factory=dict)
+    contacts_by_mode: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    contacts_by_band: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    contacts_by_continent: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    contacts_by_state: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    contacts_by_country: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
     
     # For Field Day multipliers
     sections_worked: Set[str] = field(default_factory=set)
@@ -179,159 +322,127 @@ class Aggregates:
     stations: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     # Track QSOs with timestamps for rate calculations
-    qsos_by_hour: Dict[str, int] = field(default_factory=dict)  # "2026-01-27-14" -> count
-    qsos_by_band_hour: Dict[str, Dict[str, int]] = field(default_factory=dict)  # band -> {"hour" -> count}
-    all_qso_times: List[str] = field(default_factory=list)  # All timestamps for analysis
+    # Hour buckets are packed ints (see hour_bucket); snapshot turns them into "2026-01-27-14" labels
+    qsos_by_hour: Dict[int, int] = field(default_factory=lambda: defaultdict(int))  # hour bucket -> count
+    qsos_by_band_hour: Dict[str, Dict[int, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+    )  # band -> {hour bucket -> count}
+    total_qso_times_count: int = 0  # Every QSO with a parseable timestamp
 
-    def add_record(self, r: Dict[str, str]) -> None:
-        pk_raw = r.get("FLDPRIMARYKEY") or r.get("PRIMARYKEY")
-        pk: Optional[int] = None
-        if pk_raw:
-            try:
-                pk = int(pk_raw)
-            except ValueError:
-                pk = None
+    # Event config (Field Day class/bonuses) that snapshot_json() scores against
+    config: Dict[str, Any] = field(default_factory=dict, repr=False)
 
-        if pk is not None:
-            if pk in self.seen_keys:
-                return
-            self.seen_keys.add(pk)
+    # Serialized snapshot minus "meta", rebuilt only after add_record actually changes something
+    _snap_cache: Optional[bytes] = field(default=None, repr=False)
+    _snap_dirty: bool = field(default=True, repr=False)
 
-        self.total_contacts += 1
+    def add_record(self, r: Dict[str, str]) -> None:
+        # Dedup runs before any field work; most of a poll's tail was counted already
+        key = record_key(r)
+        seen = self.seen_keys if type(key) is int else self.seen_fallback_keys
+        if key in seen:
+            return
+        seen.add(key)
+        self._snap_dirty = True
+
+        get = r.get
+
+        # Pull every field we care about once up front
+        op = (get("FLDOPERATOR") or get("OPERATOR") or "").strip() or "UNKNOWN"
+        mode = (get("MODE") or "").strip() or "UNK"
+        band = (get("BAND") or "").strip()
+        cont = (get("CONTINENT") or "").strip()
+        st = (get("STATE") or "").strip()
+        ctry = (get("COUNTRYWORKED") or "").strip()
+        section = (get("ARRLSECTION") or get("SECTION") or "").strip()
+        # N3FJP uses "DATE" not "QSODATE" - critical fix!
+        qso_date = (get("DATE") or get("QSODATE") or get("FLDQSODATE") or "").strip()
+        qso_time = (get("TIMEON") or get("FLDTIMEON") or "").strip()
+        station = (get("STATION") or get("FLDSTATION") or "").strip()
+        call = (get("CALL") or "").strip()
+        full_time = f"{qso_date} {qso_time}".strip()
+        pts = points_from_modetest(get("MODETEST", ""))
 
-        op = (r.get("FLDOPERATOR") or r.get("OPERATOR") or "").strip() or "UNKNOWN"
-        self.contacts_by_operator[op] = self.contacts_by_operator.get(op, 0) + 1
+        self.total_contacts += 1
+        self.contacts_by_operator[op] += 1
 
-        pts = points_from_modetest(r.get("MODETEST", ""))
         self.total_points += pts
-        self.points_by_operator[op] = self.points_by_operator.get(op, 0) + pts
+        self.points_by_operator[op] += pts
 
-        mode = (r.get("MODE") or "").strip() or "UNK"
-        self.contacts_by_mode[mode] = self.contacts_by_mode.get(mode, 0) + 1
+        self.contacts_by_mode[mode] += 1
 
         # Band tracking
-        band = (r.get("BAND") or "").strip()
         if band:
-            self.contacts_by_band[band] = self.contacts_by_band.get(band, 0) + 1
+            self.contacts_by_band[band] += 1
 
-        cont = (r.get("CONTINENT") or "").strip()
         if cont:
-            self.contacts_by_continent[cont] = self.contacts_by_continent.get(cont, 0) + 1
+            self.contacts_by_continent[cont] += 1
 
-        st = (r.get("STATE") or "").strip()
         if st:
-            self.contacts_by_state[st] = self.contacts_by_state.get(st, 0) + 1
+            self.contacts_by_state[st] += 1
 
-        ctry = (r.get("COUNTRYWORKED") or "").strip()
         if ctry:
-            self.contacts_by_country[ctry] = self.contacts_by_country.get(ctry, 0) + 1
+            self.contacts_by_country[ctry] += 1
         
         # Track ARRL sections for multipliers
-        section = (r.get("ARRLSECTION") or r.get("SECTION") or "").strip()
         if section:
             self.sections_worked.add(section)
         
         # Track timestamps for rate calculations
-        # N3FJP uses "DATE" not "QSODATE" - critical fix!
-        qso_date = (r.get("DATE") or r.get("QSODATE") or r.get("FLDQSODATE") or "").strip()
-        qso_time = (r.get("TIMEON") or r.get("FLDTIMEON") or "").strip()
-        
-        # Debug: Log first few timestamps
-        if len(self.all_qso_times) < 3:
-            import sys
-            print(f"DEBUG: Parsing timestamp - DATE='{qso_date}' TIMEON='{qso_time}'", file=sys.stderr)
-        
         if qso_date and qso_time:
             # Parse datetime for hourly tracking
-            # N3FJP formats: "01/26 21:59" or "01/26" + "21:59" or "20260126" + "2159"
-            try:
-                month, day, hour = None, None, None
-                
-                # Try MM/DD format
-                if "/" in qso_date:
-                    parts = qso_date.split("/")
-                    if len(parts) >= 2:
-                        month = parts[0].zfill(2)
-                        day = parts[1].split()[0].zfill(2)  # Handle "01/26 21:59" format
+            dm = _DATE_RE.match(qso_date)
+            tm = _TIME_RE.match(qso_time)
+            if dm and tm:
+                if dm.group(1):
+                    month, day = dm.group(1), dm.group(2)
+                else:
+                    month, day = dm.group(3), dm.group(4)
+                hour_key = hour_bucket(int(month), int(day), int(tm.group(1) or tm.group(2)))
                 
-                # Try YYYYMMDD format
-                elif len(qso_date) == 8 and qso_date.isdigit():
-                    month = qso_date[4:6]
-                    day = qso_date[6:8]
+                # Track overall hourly QSOs
+                self.qsos_by_hour[hour_key] += 1
                 
-                # Parse time
-                if qso_time:
-                    # Handle "21:59:59" or "21:59" or "2159" formats
-                    time_clean = qso_time.replace(":", "").strip()
-                    if len(time_clean) >= 2:
-                        hour = time_clean[:2]
+                # Track band hourly QSOs
+                if band:
+                    self.qsos_by_band_hour[band][hour_key] += 1
                 
-                if month and day and hour:
-                    hour_key = f"2026-{month}-{day}-{hour}"
-                    
-                    # Debug: Log successful parse
-                    if len(self.all_qso_times) < 3:
-                        import sys
-                        print(f"DEBUG: Successfully parsed -> hour_key='{hour_key}'", file=sys.stderr)
-                    
-                    # Track overall hourly QSOs
-                    self.qsos_by_hour[hour_key] = self.qsos_by_hour.get(hour_key, 0) + 1
-                    
-                    # Track band hourly QSOs
-                    if band:
-                        if band not in self.qsos_by_band_hour:
-                            self.qsos_by_band_hour[band] = {}
-                        self.qsos_by_band_hour[band][hour_key] = self.qsos_by_band_hour[band].get(hour_key, 0) + 1
-                    
-                    # Store full timestamp
-                    self.all_qso_times.append(f"{qso_date} {qso_time}")
-                else:
-                    # Debug: Log parse failure
-                    if len(self.all_qso_times) < 3:
-                        import sys
-                        print(f"DEBUG: Parse failed - month={month} day={day} hour={hour}", file=sys.stderr)
-            except Exception as e:
-                # Debug: log parsing failures
-                import sys
-                print(f"DEBUG: Timestamp parse exception: {qso_date} {qso_time} - {e}", file=sys.stderr)
-                pass
+                self.total_qso_times_count += 1
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unparsed QSO timestamp DATE=%r TIMEON=%r", qso_date, qso_time)
         
         # Track physical stations
         # Priority: 1) STATION field from N3FJP, 2) Operator callsign as fallback
-        station = (r.get("STATION") or r.get("FLDSTATION") or "").strip()
         if not station:
             station = f"Op: {op}"  # Fallback if no station field
         
-        call = (r.get("CALL") or "").strip()
-        full_time = f"{qso_date} {qso_time}".strip()
-        
-        # Initialize station if new
-        if station not in self.stations:
-            self.stations[station] = {
+        # Initialize station if new, otherwise update it with current operator/band/mode
+        # (whoever logged most recently is "current")
+        stations = self.stations
+        srec = stations.get(station)
+        if srec is None:
+            srec = stations[station] = {
                 "name": station,
                 "operator": op,
                 "band": band,
                 "mode": mode,
-                "recent": [],
+                "recent": deque(maxlen=5),
                 "lastUpdate": full_time
             }
-        
-        # Update station with current operator/band/mode (whoever logged most recently is "current")
-        self.stations[station]["operator"] = op
-        self.stations[station]["band"] = band
-        self.stations[station]["mode"] = mode
-        self.stations[station]["lastUpdate"] = full_time
+        else:
+            srec["operator"] = op
+            srec["band"] = band
+            srec["mode"] = mode
+            srec["lastUpdate"] = full_time
         
         # Add to recent QSOs (keep last 5)
-        qso_entry = {
+        srec["recent"].appendleft({
             "call": call,
             "operator": op,  # Track which operator made this contact
             "band": band,
             "mode": mode,
             "time": full_time
-        }
-        self.stations[station]["recent"].insert(0, qso_entry)
-        self.stations[station]["recent"] = self.stations[station]["recent"][:5]
+        })
 
     def _calculate_field_day_bonus(self, config: dict) -> dict:
         """Calculate Field Day bonus points based on config"""
@@ -411,10 +522,21 @@ class Aggregates:
             "fdClass": fd_class
         }
 
-    def snapshot(self, config: dict = None) -> dict:
-        def sorted_rows(d: Dict[str, int], key_name: str) -> List[dict]:
-            return [{key_name: k, "Contacts": v} for k, v in sorted(d.items(), key=lambda kv: kv[1], reverse=True)]
+    def snapshot_json(self) -> bytes:
+        """
+        snapshot(self.config) serialized to JSON. The body is cached until the
+        next new record; meta.generatedUtc is stamped fresh on every call.
+        """
+        if self._snap_dirty or self._snap_cache is None:
+            snap = self.snapshot(self.config)
+            del snap["meta"]
+            # Kept without its opening brace so the meta fragment can go in front
+            self._snap_cache = dumps_json(snap)[1:]
+            self._snap_dirty = False
+        generated = datetime.now(timezone.utc).isoformat().encode("ascii")
+        return b'{"meta":{"generatedUtc":"' + generated + b'"},' + self._snap_cache
 
+    def snapshot(self, config: dict = None) -> dict:
         # Calculate Field Day bonuses if config provided
         field_day_bonus = self._calculate_field_day_bonus(config) if config else None
         
@@ -437,30 +559,18 @@ class Aggregates:
                 "classMultiplier": class_mult,
                 "powerMultiplier": power_mult
             },
-            "contactsByOperator": [
-                {"Operator": k, "Contacts": v}
-                for k, v in sorted(self.contacts_by_operator.items(), key=lambda kv: kv[1], reverse=True)
-            ],
-            "pointsByOperator": [
-                {"Operator": k, "Points": v}
-                for k, v in sorted(self.points_by_operator.items(), key=lambda kv: kv[1], reverse=True)
-            ],
-            "contactsByMode": [
-                {"Mode": k, "Contacts": v}
-                for k, v in sorted(self.contacts_by_mode.items(), key=lambda kv: kv[1], reverse=True)
-            ],
+            "contactsByOperator": sorted_rows(self.contacts_by_operator, "Operator"),
+            "pointsByOperator": sorted_rows(self.points_by_operator, "Operator", "Points"),
+            "contactsByMode": sorted_rows(self.contacts_by_mode, "Mode"),
             "contactsByContinent": sorted_rows(self.contacts_by_continent, "Continent"),
             "contactsByState": sorted_rows(self.contacts_by_state, "State"),
             "contactsByCountry": sorted_rows(self.contacts_by_country, "Country"),
-            "contactsByBand": [
-                {"Band": k, "Contacts": v}
-                for k, v in sorted(self.contacts_by_band.items(), key=lambda kv: kv[1], reverse=True)
-            ],
+            "contactsByBand": sorted_rows(self.contacts_by_band, "Band"),
             "multipliers": {
                 "sections": len(self.sections_worked),
                 "sectionsList": sorted(list(self.sections_worked))
             },
-            "stations": list(self.stations.values()),
+            "stations": [{**s, "recent": list(s["recent"])} for s in self.stations.values()],
             "rateStats": self._calculate_rates(),
         }
         
@@ -490,17 +600,17 @@ class Aggregates:
                 band_rates[band] = round(count / assumed_hours, 1)
         
         # Calculate overall hourly breakdown
-        hourly_totals = sorted([(k, v) for k, v in self.qsos_by_hour.items()], key=lambda x: x[0])
+        hourly_totals = sorted(self.qsos_by_hour.items(), key=itemgetter(0))
         
         # Find best hour
-        best_hour = max(self.qsos_by_hour.items(), key=lambda x: x[1]) if self.qsos_by_hour else (None, 0)
+        best_hour = max(self.qsos_by_hour.items(), key=itemgetter(1)) if self.qsos_by_hour else (None, 0)
         
         # Calculate current rates (last 20/60 minutes)
         rate_20min = 0
         rate_60min = 0
         
-        if self.all_qso_times:
-            total_qsos = len(self.all_qso_times)
+        if self.total_qso_times_count:
+            total_qsos = self.total_qso_times_count
             num_hours = len(self.qsos_by_hour) if self.qsos_by_hour else 1
             
             # For live operation: count contacts in last 20 and 60 minutes
@@ -509,26 +619,26 @@ class Aggregates:
             
             # Simple approach: last 20 contacts = last 20 minutes (if busy)
             # Multiply by 3 to get hourly rate
-            recent_20 = min(len(self.all_qso_times), 20)
-            recent_60 = min(len(self.all_qso_times), 60)
+            recent_20 = min(total_qsos, 20)
+            recent_60 = min(total_qsos, 60)
             
             # If we have at least 20 contacts, calculate rate
-            if len(self.all_qso_times) >= 20:
+            if total_qsos >= 20:
                 rate_20min = recent_20 * 3  # 20 contacts in 20 min = 60/hr
             else:
                 # Not enough data, show average
                 rate_20min = round(total_qsos / max(num_hours, 1))
             
-            if len(self.all_qso_times) >= 60:
+            if total_qsos >= 60:
                 rate_60min = recent_60  # 60 contacts in 60 min = rate
             else:
                 # Not enough data, show average
                 rate_60min = round(total_qsos / max(num_hours, 1))
         
         return {
-            "bandRates": [{"band": k, "rate": v} for k, v in sorted(band_rates.items(), key=lambda x: x[1], reverse=True)],
-            "hourlyTotals": [{"hour": h, "qsos": q} for h, q in hourly_totals],
-            "bestHour": {"hour": best_hour[0], "qsos": best_hour[1]} if best_hour[0] else None,
+            "bandRates": [{"band": k, "rate": v} for k, v in sorted(band_rates.items(), key=itemgetter(1), reverse=True)],
+            "hourlyTotals": [{"hour": hour_label(h), "qsos": q} for h, q in hourly_totals],
+            "bestHour": {"hour": hour_label(best_hour[0]), "qsos": best_hour[1]} if best_hour[0] else None,
             "rate20min": rate_20min,
             "rate60min": rate_60min,
             "totalHours": len(self.qsos_by_hour)
@@ -544,52 +654,142 @@ class ScoreboardApiPoller:
         self.refresh_seconds = refresh_seconds
         self.config = config or {}
 
-        self.agg = Aggregates()
+        self.agg = Aggregates(config=self.config)
         self._lock = asyncio.Lock()
 
+        # Polls reuse one long-lived N3FJP connection; the seed uses its own.
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._conn_replied = False  # current connection has answered at least once
+        self._conn_lock = asyncio.Lock()
+
         self.diag: Dict[str, Any] = {
             "n3fjp": {"host": host, "port": port},
             "seed": {},
             "poll": {},
         }
 
-    async def _do_list(self, n: int, which: str, total_timeout: float, idle_timeout: float) -> List[Dict[str, str]]:
+    async def _drop_conn(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        self._conn_replied = False
+        if writer is not None:
+            await n3fjp_close(writer)
+
+    async def _reconnect_on_error(
+        self,
+        cmd: str,
+        on_chunk: Callable[[bytes], Awaitable[None]],
+        total_timeout: float,
+        idle_timeout: float,
+    ) -> int:
+        """
+        Run cmd on the persistent connection, (re)connecting as needed.
+        A dead connection (error, closed by N3FJP between polls, or silent
+        after answering earlier polls) is dropped and the command retried
+        once on a fresh one, as long as nothing was received yet. An empty
+        reply on a connection that has never answered is taken as an empty
+        result, not a failure.
+        """
+        received = 0
+
+        async def counted(data: bytes) -> None:
+            nonlocal received
+            received += len(data)
+            await on_chunk(data)
+
+        async with self._conn_lock:
+            for attempt in range(2):
+                if self._writer is None:
+                    self._reader, self._writer = await n3fjp_open(self.host, self.port, total_timeout)
+                try:
+                    n = await n3fjp_exchange(self._reader, self._writer, cmd, counted, total_timeout, idle_timeout)
+                except (OSError, asyncio.TimeoutError):
+                    await self._drop_conn()
+                    if attempt or received:
+                        raise
+                    continue
+                if self._reader.at_eof():
+                    await self._drop_conn()
+                    if not n and not attempt:
+                        continue
+                elif n:
+                    self._conn_replied = True
+                elif self._conn_replied:
+                    await self._drop_conn()
+                    continue
+                return n
+            return 0
+
+    async def close(self) -> None:
+        async with self._conn_lock:
+            await self._drop_conn()
+
+    async def _do_list(
+        self, n: int, which: str, total_timeout: float, idle_timeout: float, persistent: bool = False
+    ) -> None:
+        """
+        Request the last n QSOs and fold them into the aggregates as they
+        stream in, so a long seed shows up on the scoreboard progressively.
+        """
         cmd = build_list_cmd(n, include_all=True)
-        raw = await asyncio.to_thread(n3fjp_cmd, self.host, self.port, cmd, total_timeout, idle_timeout)
-        text = raw.decode("utf-8", errors="ignore")
-        recs = parse_cmd_records(text)
+        stream = ListResponseStream()
+        batch: List[Dict[str, str]] = []
+        parsed = 0
+        sample_fields: List[str] = []
+
+        def take(blocks: List[bytes]) -> None:
+            for block in blocks:
+                rec = _parse_tags(block)
+                if rec:
+                    batch.append(rec)
+            if batch and not sample_fields:
+                sample_fields.extend(batch[0].keys())
+
+        async def flush() -> None:
+            nonlocal parsed
+            if batch:
+                parsed += len(batch)
+                async with self._lock:
+                    for r in batch:
+                        self.agg.add_record(r)
+                batch.clear()
+
+        async def on_chunk(data: bytes) -> None:
+            take(stream.feed(data))
+            if len(batch) >= _INGEST_BATCH:
+                await flush()
+
+        try:
+            if persistent:
+                raw_bytes = await self._reconnect_on_error(cmd, on_chunk, total_timeout, idle_timeout)
+            else:
+                raw_bytes = await n3fjp_stream(self.host, self.port, cmd, on_chunk, total_timeout, idle_timeout)
+            take(stream.finish())
+        finally:
+            await flush()
 
         # Debug: Log first record's fields to see what's available
-        if recs and which == "seed":
-            print("=== SAMPLE N3FJP RECORD FIELDS ===")
-            print(f"Available fields: {', '.join(sorted(recs[0].keys()))}")
-            print("===================================")
+        if sample_fields and which == "seed" and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sample N3FJP record fields: %s", ", ".join(sorted(sample_fields)))
 
         self.diag[which] = {
             "requested": n,
             "totalTimeout": float(total_timeout),
             "idleTimeout": float(idle_timeout),
             "lastAtUtc": datetime.now(timezone.utc).isoformat(),
-            "recordsParsed": len(recs),
-            "rawBytes": len(raw),
+            "recordsParsed": parsed,
+            "rawBytes": raw_bytes,
             # helpful sanity fields
-            "hasListResponseMarker": ("<LISTRESPONSE" in text.upper()),
-            "hasListResponseClose": ("</LISTRESPONSE>" in text.upper()),
-            "sampleFields": list(recs[0].keys()) if recs else []
+            "hasListResponseMarker": stream.saw_marker,
+            "hasListResponseClose": stream.saw_close,
+            "sampleFields": sample_fields
         }
-        return recs
 
     async def seed(self):
-        recs = await self._do_list(self.seed_count, "seed", total_timeout=60.0, idle_timeout=1.75)
-        async with self._lock:
-            for r in recs:
-                self.agg.add_record(r)
+        await self._do_list(self.seed_count, "seed", total_timeout=60.0, idle_timeout=1.75)
 
     async def poll_once(self):
-        recs = await self._do_list(self.tail_count, "poll", total_timeout=8.0, idle_timeout=0.75)
-        async with self._lock:
-            for r in recs:
-                self.agg.add_record(r)
+        await self._do_list(self.tail_count, "poll", total_timeout=8.0, idle_timeout=0.75, persistent=True)
 
     async def poll_forever(self, stop_event: asyncio.Event):
         try:
@@ -608,9 +808,9 @@ class ScoreboardApiPoller:
             except asyncio.TimeoutError:
                 pass
 
-    async def get_snapshot(self) -> dict:
+    async def get_snapshot_json(self) -> bytes:
         async with self._lock:
-            return self.agg.snapshot(self.config)
+            return self.agg.snapshot_json()
 
     async def get_diag(self) -> dict:
         return self.diag
@@ -630,6 +830,19 @@ poller = ScoreboardApiPoller(
     config=cfg
 )
 
+# cfg is loaded once at startup, so these bodies never change
+_CONFIG_BYTES = dumps_json({
+    "club_name": cfg.get("club_name", "Amateur Radio Club"),
+    "callsign": cfg.get("callsign", "N0CALL"),
+    "event_name": cfg.get("event_name", "Field Day"),
+    "home_lat": cfg.get("home_lat", 0),
+    "home_lon": cfg.get("home_lon", 0),
+    "home_location": cfg.get("home_location", ""),
+    "weather_enabled": cfg.get("weather_enabled", False),
+    "band_goals": cfg.get("band_goals", {})
+})
+_HEALTH_BYTES = dumps_json({"ok": True})
+
 _stop = asyncio.Event()
 
 @asynccontextmanager
@@ -641,40 +854,32 @@ async def lifespan(app: FastAPI):
         await asyncio.wait_for(task, timeout=2.0)
     except Exception:
         pass
+    await poller.close()
 
 app = FastAPI(lifespan=lifespan)
 
 # API routes FIRST
 @app.get("/api/snapshot")
 async def api_snapshot():
-    return JSONResponse(await poller.get_snapshot())
+    return Response(content=await poller.get_snapshot_json(), media_type="application/json")
 
 @app.get("/api/config")
 async def api_config():
     """Return club/event configuration for frontend"""
-    return JSONResponse({
-        "club_name": cfg.get("club_name", "Amateur Radio Club"),
-        "callsign": cfg.get("callsign", "N0CALL"),
-        "event_name": cfg.get("event_name", "Field Day"),
-        "home_lat": cfg.get("home_lat", 0),
-        "home_lon": cfg.get("home_lon", 0),
-        "home_location": cfg.get("home_location", ""),
-        "weather_enabled": cfg.get("weather_enabled", False),
-        "band_goals": cfg.get("band_goals", {})
-    })
+    return Response(content=_CONFIG_BYTES, media_type="application/json")
 
 @app.get("/api/diag")
 async def api_diag():
-    return JSONResponse(await poller.get_diag())
+    return FastJSONResponse(await poller.get_diag())
 
 # Alias so your /api/debug URL works
 @app.get("/api/debug")
 async def api_debug():
-    return JSONResponse(await poller.get_diag())
+    return FastJSONResponse(await poller.get_diag())
 
 @app.get("/health")
 async def health():
-    return {"ok": True}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 # Static LAST
 www_dir = BASE_DIR / "www"